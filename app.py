@@ -5,7 +5,7 @@ import os
 
 from functools import partial
 
-from authlib.jose import JsonWebKey
+from cachetools.func import lru_cache
 from cryptography.hazmat.primitives import serialization
 from flask import Flask, request, Request
 from flask_login import LoginManager
@@ -13,6 +13,8 @@ from flask_mail import Mail
 from flask_principal import Principal
 from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.exceptions import HTTPException
+from werkzeug.local import LocalProxy
+from werkzeug.utils import cached_property
 
 import features
 
@@ -53,7 +55,7 @@ from oauth.services.github import GithubOAuthService
 from oauth.services.gitlab import GitLabOAuthService
 from oauth.loginmanager import OAuthLoginManager
 from storage import Storage
-from util.log import filter_logs
+from util.log import compile_log_filters, filter_logs
 from util import get_app_url
 from util.secscan.secscan_util import get_blob_download_uri_getter
 from util.ipresolver import IPResolver
@@ -67,6 +69,7 @@ from util.metrics.prometheus import PrometheusPlugin
 from util.repomirror.api import RepoMirrorAPI
 from util.tufmetadata.api import TUFMetadataAPI
 from util.security.instancekeys import InstanceKeys
+from util.security.signingkey import load_or_generate_signing_key
 from util.greenlet_tracing import enable_tracing
 
 OVERRIDE_CONFIG_YAML_FILENAME = os.path.join(OVERRIDE_CONFIG_DIRECTORY, "config.yaml")
@@ -101,15 +104,17 @@ else:
 config_provider.update_app_config(app.config)
 
 # Update any configuration found in the override environment variable.
-environ_config = json.loads(os.environ.get(OVERRIDE_CONFIG_KEY, "{}"))
-app.config.update(environ_config)
+_environ_config_raw = os.environb.get(OVERRIDE_CONFIG_KEY.encode("utf-8"))
+if _environ_config_raw:
+    app.config.update(json.loads(_environ_config_raw))
 
 # Fix remote address handling for Flask.
 if app.config.get("PROXY_COUNT", 1):
     app.wsgi_app = ProxyFix(app.wsgi_app)
 
 # Allow user to define a custom storage preference for the local instance.
-_distributed_storage_preference = os.environ.get("QUAY_DISTRIBUTED_STORAGE_PREFERENCE", "").split()
+_distributed_storage_preference_env = os.environ.get("QUAY_DISTRIBUTED_STORAGE_PREFERENCE")
+_distributed_storage_preference = (_distributed_storage_preference_env or "").split()
 if _distributed_storage_preference:
     app.config["DISTRIBUTED_STORAGE_PREFERENCE"] = _distributed_storage_preference
 
@@ -142,7 +147,23 @@ if features.HELM_OCI_SUPPORT:
     ]
     register_artifact_type(HELM_CHART_CONFIG_TYPE, HELM_CHART_LAYER_TYPES)
 
-CONFIG_DIGEST = hashlib.sha256(json.dumps(app.config, default=str).encode("utf-8")).hexdigest()[0:8]
+
+def _config_digest(config):
+    """
+    Returns a short digest of the given config, hashing it one key at a time so that the config is
+    never serialized into a single string.
+    """
+    digest = hashlib.blake2b(digest_size=4)
+    for key in sorted(config):
+        digest.update(key.encode("utf-8"))
+        digest.update(b"=")
+        digest.update(json.dumps(config[key], default=str).encode("utf-8"))
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+CONFIG_DIGEST = _config_digest(app.config)
 
 logger.debug("Loaded config", extra={"config": app.config})
 
@@ -150,9 +171,9 @@ logger.debug("Loaded config", extra={"config": app.config})
 class RequestWithId(Request):
     request_gen = staticmethod(urn_generator(["request"]))
 
-    def __init__(self, *args, **kwargs):
-        super(RequestWithId, self).__init__(*args, **kwargs)
-        self.request_id = self.request_gen()
+    @cached_property
+    def request_id(self):
+        return self.request_gen()
 
 
 @app.before_request
@@ -169,6 +190,9 @@ def _request_start():
             suspend=False,
         )
 
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     debug_extra = {}
     x_forwarded_for = request.headers.get("X-Forwarded-For", None)
     if x_forwarded_for is not None:
@@ -185,25 +209,33 @@ FILTERED_VALUES = [
     {"key": ["user", "password"], "fn": DEFAULT_FILTER},
     {"key": ["blob"], "fn": lambda x: x[0:8]},
 ]
+_FILTER_INDEX = compile_log_filters(FILTERED_VALUES)
+_FILTER_KEYS = frozenset(key for key_path in _FILTER_INDEX for key in key_path)
 
 
 @app.after_request
 def _request_end(resp):
+    if not logger.isEnabledFor(logging.DEBUG):
+        return resp
+
     try:
         jsonbody = request.get_json(force=True, silent=True)
     except HTTPException:
         jsonbody = None
 
-    values = request.values.to_dict()
-
     if isinstance(jsonbody, dict):
-        filter_logs(jsonbody, FILTERED_VALUES)
+        filter_logs(jsonbody, _FILTER_INDEX)
 
     if jsonbody and not isinstance(jsonbody, dict):
         jsonbody = {"_parsererror": jsonbody}
 
-    if isinstance(values, dict):
-        filter_logs(values, FILTERED_VALUES)
+    # Only materialize the request values when there are any, and only filter them when one of the
+    # filtered keys is present.
+    values = {}
+    if request.args or request.form:
+        values = request.values.to_dict()
+        if not _FILTER_KEYS.isdisjoint(values):
+            filter_logs(values, _FILTER_INDEX)
 
     extra = {
         "endpoint": request.endpoint,
@@ -224,7 +256,7 @@ def _request_end(resp):
     return resp
 
 
-if app.config.get("GREENLET_TRACING", True):
+if app.config.get("GREENLET_TRACING", False):
     enable_tracing()
 
 root_logger = logging.getLogger()
@@ -232,16 +264,26 @@ root_logger = logging.getLogger()
 app.request_class = RequestWithId
 
 # Register custom converters.
-app.url_map.converters["regex"] = RegexConverter
-app.url_map.converters["repopath"] = RepositoryPathConverter
-app.url_map.converters["apirepopath"] = APIRepositoryPathConverter
-app.url_map.converters["repopathredirect"] = RepositoryPathRedirectConverter
-app.url_map.converters["v1createrepopath"] = V1CreateRepositoryPathConverter
+app.url_map.converters.update(
+    {
+        "regex": RegexConverter,
+        "repopath": RepositoryPathConverter,
+        "apirepopath": APIRepositoryPathConverter,
+        "repopathredirect": RepositoryPathRedirectConverter,
+        "v1createrepopath": V1CreateRepositoryPathConverter,
+    }
+)
 
 Principal(app, use_sessions=False)
 
 tf = app.config["DB_TRANSACTION_FACTORY"]
 
+
+@lru_cache(maxsize=1)
+def _get_analytics():
+    return Analytics(app)
+
+
 model_cache = get_model_cache(app.config)
 avatar = Avatar(app)
 login_manager = LoginManager(app)
@@ -253,14 +295,14 @@ ip_resolver = IPResolver(app)
 storage = Storage(app, chunk_cleanup_queue, instance_keys, config_provider, ip_resolver)
 userfiles = Userfiles(app, storage)
 log_archive = LogArchive(app, storage)
-analytics = Analytics(app)
+# Analytics starts its Mixpanel sender thread when constructed, so only build it once it is used.
+analytics = LocalProxy(_get_analytics)
 billing = Billing(app)
 sentry = Sentry(app)
 build_logs = BuildLogs(app)
 authentication = UserAuthentication(app, config_provider, OVERRIDE_CONFIG_DIRECTORY)
 userevents = UserEventsBuilderModule(app)
 usermanager = UserManager(app, authentication)
-instance_keys = InstanceKeys(app)
 label_validator = LabelValidator(app)
 build_canceller = BuildCanceller(app)
 
@@ -312,14 +354,10 @@ tuf_metadata_api = TUFMetadataAPI(app, app.config)
 
 # Check for a key in config. If none found, generate a new signing key for Docker V2 manifests.
 _v2_key_path = os.path.join(OVERRIDE_CONFIG_DIRECTORY, DOCKER_V2_SIGNINGKEY_FILENAME)
-if os.path.exists(_v2_key_path):
-    with open(_v2_key_path) as key_file:
-        docker_v2_signing_key = JsonWebKey.import_key(key_file.read())
-else:
-    docker_v2_signing_key = JsonWebKey.generate_key("RSA", 2048, is_private=True)
+docker_v2_signing_key = load_or_generate_signing_key(_v2_key_path, persist=not is_testing)
 
 # Check if georeplication is turned on and whether env. variables exist:
-if os.environ.get("QUAY_DISTRIBUTED_STORAGE_PREFERENCE") is None and app.config.get(
+if _distributed_storage_preference_env is None and app.config.get(
     "FEATURE_STORAGE_REPLICATION", False
 ):
     raise Exception(
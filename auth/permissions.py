@@ -34,6 +34,8 @@ REPO_ROLES = [None, "read", "write", "admin"]
 TEAM_ROLES = [None, "member", "creator", "admin"]
 USER_ROLES = [None, "read", "admin"]
 
+SIGNED_AUTH_TYPES = frozenset({"signed_grant", "signed_jwt"})
+
 TEAM_ORGWIDE_REPO_ROLES = {
     "admin": "admin",
     "creator": None,
@@ -407,7 +409,7 @@ def on_identity_loaded(sender, identity):
         logger.debug("Delegate token added permission: %s", repo_grant)
         identity.provides.add(repo_grant)
 
-    elif identity.auth_type == "signed_grant" or identity.auth_type == "signed_jwt":
+    elif identity.auth_type in SIGNED_AUTH_TYPES:
         logger.debug("Loaded %s identity for: %s", identity.auth_type, identity.id)
 
     else:
@@ -711,8 +711,9 @@ class DefaultConfig(ImmutableConfig):
     FEATURE_NAMESPACE_GARBAGE_COLLECTION = True
     FEATURE_REPOSITORY_GARBAGE_COLLECTION = True
 
-    # When enabled, sets a tracing callback to report greenlet metrics.
-    GREENLET_TRACING = True
+    # When enabled, sets a tracing callback to report greenlet metrics. The callback runs on every
+    # greenlet switch, so this is off unless explicitly opted into.
+    GREENLET_TRACING = False
 
     # The timeout after which a fresh login check is required for sensitive operations.
     FRESH_LOGIN_TIMEOUT = "10m"
@@ -1,4 +1,7 @@
+import hashlib
+import json
 import logging
+import os
 import yaml
 
 from abc import ABCMeta, abstractmethod
@@ -27,19 +30,77 @@ class SetupIncompleteException(Exception):
     pass
 
 
+def _yaml_cache_path(config_file):
+    return config_file + ".json.cache"
+
+
+def _write_yaml_cache(contents, cache_file, yaml_digest):
+    """
+    Writes the given parsed YAML contents to the JSON cache file, along with the digest of the YAML
+    bytes they were parsed from. Contents which cannot round-trip through JSON unchanged are not
+    cached.
+    """
+    try:
+        serialized = json.dumps(contents)
+    except (TypeError, ValueError):
+        logger.debug("YAML config cannot be represented as JSON; skipping cache")
+        return
+
+    if json.loads(serialized) != contents:
+        logger.debug("YAML config does not round-trip through JSON; skipping cache")
+        return
+
+    tmp_file = cache_file + ".tmp"
+    try:
+        # The cache holds every secret in the config, so only its owner may read it.
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write('{"digest": %s, "config": %s}' % (json.dumps(yaml_digest), serialized))
+
+        os.replace(tmp_file, cache_file)
+    except OSError as ose:
+        logger.debug("Could not write YAML config cache %s: %s", cache_file, ose)
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def load_yaml(config_file):
+    """
+    Loads the given YAML config file, using a JSON cache stored alongside it when that cache was
+    generated from the exact current contents of the file.
+    """
+    with open(config_file, "rb") as f:
+        yaml_bytes = f.read()
+
+    yaml_digest = hashlib.blake2b(yaml_bytes).hexdigest()
+    cache_file = _yaml_cache_path(config_file)
+
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+
+        if cached["digest"] == yaml_digest:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    c = yaml.safe_load(yaml_bytes)
+    _write_yaml_cache(c, cache_file, yaml_digest)
+    return c
+
+
 def import_yaml(config_obj, config_file):
-    with open(config_file) as f:
-        c = yaml.safe_load(f)
-        if not c:
-            logger.debug("Empty YAML config file")
-            return
-
-        if isinstance(c, str):
-            raise Exception("Invalid YAML config file: " + str(c))
-
-        for key in c.keys():
-            if key.isupper():
-                config_obj[key] = c[key]
+    c = load_yaml(config_file)
+    if not c:
+        logger.debug("Empty YAML config file")
+        return
+
+    if isinstance(c, str):
+        raise Exception("Invalid YAML config file: " + str(c))
+
+    for key in c.keys():
+        if key.isupper():
+            config_obj[key] = c[key]
 
     # if config_obj.get("SETUP_COMPLETE", True):
     #     try:
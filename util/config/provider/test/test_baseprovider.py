@@ -0,0 +1,62 @@
+import datetime
+import os
+import stat
+
+from util.config.provider.baseprovider import import_yaml, load_yaml
+
+
+def test_import_yaml_writes_cache(tmpdir):
+    config_file = str(tmpdir.join("config.yaml"))
+    with open(config_file, "w") as f:
+        f.write("SERVER_HOSTNAME: localhost\nlowercase: ignored\n")
+
+    config_obj = {}
+    import_yaml(config_obj, config_file)
+    assert config_obj == {"SERVER_HOSTNAME": "localhost"}
+
+    cache_file = config_file + ".json.cache"
+    assert os.path.exists(cache_file)
+    assert stat.S_IMODE(os.stat(cache_file).st_mode) == 0o600
+    assert load_yaml(config_file) == {"SERVER_HOSTNAME": "localhost", "lowercase": "ignored"}
+
+
+def test_load_yaml_ignores_stale_cache(tmpdir):
+    config_file = str(tmpdir.join("config.yaml"))
+    with open(config_file, "w") as f:
+        f.write("SERVER_HOSTNAME: localhost\n")
+
+    assert load_yaml(config_file) == {"SERVER_HOSTNAME": "localhost"}
+
+    with open(config_file, "w") as f:
+        f.write("SERVER_HOSTNAME: quay.io\n")
+    os.utime(config_file, ns=(0, 0))
+
+    assert load_yaml(config_file) == {"SERVER_HOSTNAME": "quay.io"}
+
+
+def test_load_yaml_ignores_cache_when_contents_change_with_same_mtime(tmpdir):
+    config_file = str(tmpdir.join("config.yaml"))
+    with open(config_file, "w") as f:
+        f.write("SERVER_HOSTNAME: localhost\n")
+
+    assert load_yaml(config_file) == {"SERVER_HOSTNAME": "localhost"}
+    original_stat = os.stat(config_file)
+
+    with open(config_file, "w") as f:
+        f.write("SERVER_HOSTNAME: quay.io\n")
+    os.utime(config_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    assert os.stat(config_file).st_mtime_ns == original_stat.st_mtime_ns
+
+    assert load_yaml(config_file) == {"SERVER_HOSTNAME": "quay.io"}
+
+
+def test_load_yaml_skips_cache_for_non_json_values(tmpdir):
+    config_file = str(tmpdir.join("config.yaml"))
+    with open(config_file, "w") as f:
+        f.write("SOME_DATE: 2021-01-01\nSOME_MAP:\n  1: one\n")
+
+    assert load_yaml(config_file) == {
+        "SOME_DATE": datetime.date(2021, 1, 1),
+        "SOME_MAP": {1: "one"},
+    }
+    assert not os.path.exists(config_file + ".json.cache")
@@ -13,6 +13,7 @@ from netaddr import IPNetwork, IPAddress, IPSet, AddrFormatError
 
 import geoip2.database
 import geoip2.errors
+import maxminddb
 import requests
 from typing import Dict
 
@@ -89,8 +90,14 @@ class IPResolver(IPResolverInterface):
 
         # resolve absolute path to file
         path = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(path, "GeoLite2-Country.mmdb")
-        self.geoip_db = geoip2.database.Reader(file_path)
+        self._geoip_db_path = os.path.join(path, "GeoLite2-Country.mmdb")
+        self._geoip_db = None
+        self._geoip_db_failed = False
+        self._geoip_db_lock = Lock()
+
+        # The database is only opened on first use, so make a missing one fail at startup.
+        if not os.access(self._geoip_db_path, os.R_OK):
+            raise IOError("Could not read GeoIP database at %s" % self._geoip_db_path)
 
         self.amazon_ranges: Dict[str, IPSet] = None
         self.sync_token = None
@@ -103,6 +110,22 @@ class IPResolver(IPResolverInterface):
             self.sync_token = aws_ip_ranges_data["syncToken"]
             logger.debug("Finished building AWS IP ranges")
 
+    @property
+    def geoip_db(self):
+        """
+        Returns the GeoIP reader, opening it on first use, or None if it could not be opened.
+        """
+        if self._geoip_db is None and not self._geoip_db_failed:
+            with self._geoip_db_lock:
+                if self._geoip_db is None and not self._geoip_db_failed:
+                    try:
+                        self._geoip_db = geoip2.database.Reader(self._geoip_db_path)
+                    except (IOError, maxminddb.InvalidDatabaseError):
+                        logger.exception("Could not open GeoIP database %s", self._geoip_db_path)
+                        self._geoip_db_failed = True
+
+        return self._geoip_db
+
     @ttl_cache(maxsize=100, ttl=600)
     def is_ip_possible_threat(self, ip_address):
         if self.app.config.get("THREAT_NAMESPACE_MAXIMUM_BUILD_COUNT") is None:
@@ -152,10 +175,13 @@ class IPResolver(IPResolverInterface):
             return ResolvedLocation("invalid_ip", None, self.sync_token, None, None, None)
 
         # Try geoip classification
-        try:
-            geoinfo = self.geoip_db.country(ip_address)
-        except geoip2.errors.AddressNotFoundError:
-            geoinfo = None
+        geoinfo = None
+        geoip_db = self.geoip_db
+        if geoip_db is not None:
+            try:
+                geoinfo = geoip_db.country(ip_address)
+            except geoip2.errors.AddressNotFoundError:
+                geoinfo = None
 
         aws_region = self.get_aws_ip_region(parsed_ip)
 
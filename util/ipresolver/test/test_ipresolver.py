@@ -106,3 +106,29 @@ def test_resolved(aws_ip_range_data, test_ip_range_cache, test_aws_ip, app):
         aws_region=None,
         continent=None,
     )
+
+
+def test_missing_geoip_database_fails_at_startup(app):
+    with patch("util.ipresolver.os.access", return_value=False):
+        with pytest.raises(IOError):
+            IPResolver(app)
+
+
+def test_unreadable_geoip_database_returns_no_geo_info(app, tmpdir):
+    corrupt_db = tmpdir.join("GeoLite2-Country.mmdb")
+    corrupt_db.write("not a database")
+
+    ipresolver = IPResolver(app)
+    ipresolver._geoip_db_path = str(corrupt_db)
+    ipresolver.amazon_ranges = None
+
+    for _ in range(2):
+        assert ipresolver.resolve_ip("56.0.0.2") == ResolvedLocation(
+            provider="internet",
+            service=None,
+            sync_token=ipresolver.sync_token,
+            country_iso_code=None,
+            aws_region=None,
+            continent=None,
+        )
+    assert ipresolver._geoip_db_failed
@@ -24,9 +24,20 @@ def logfile_path(jsonfmt=False, debug=False):
     return os.path.join(CONF_DIR, "logging%s%s.conf" % (_debug, _json))
 
 
+def compile_log_filters(filtered_fields):
+    """
+    Converts a list of filters in the form accepted by `filter_logs`, eg:
+        [{'key': ['k1', 'k2'], 'fn': lambda x: 'filtered'}]
+    into a dict mapping each key path to its filter function, eg:
+        {('k1', 'k2'): lambda x: 'filtered'}
+    so that it can be built once and reused across calls to `filter_logs`.
+    """
+    return {tuple(field["key"]): field["fn"] for field in filtered_fields}
+
+
 def filter_logs(values, filtered_fields):
     """
-    Takes a dict and a list of keys to filter.
+    Takes a dict and a list of keys to filter, or the dict returned by `compile_log_filters`.
     eg:
      with filtered_fields:
         [{'key': ['k1', k2'], 'fn': lambda x: 'filtered'}]
@@ -35,14 +46,17 @@ def filter_logs(values, filtered_fields):
     the returned dict is:
       {'k1': {k2: 'filtered'}, 'k3': 'some-value'}
     """
-    for field in filtered_fields:
+    if not isinstance(filtered_fields, dict):
+        filtered_fields = compile_log_filters(filtered_fields)
+
+    for key_path, fn in filtered_fields.items():
         cdict = values
 
-        for key in field["key"][:-1]:
+        for key in key_path[:-1]:
             if key in cdict:
                 cdict = cdict[key]
 
-        last_key = field["key"][-1]
+        last_key = key_path[-1]
 
         if last_key in cdict and cdict[last_key]:
-            cdict[last_key] = field["fn"](cdict[last_key])
+            cdict[last_key] = fn(cdict[last_key])
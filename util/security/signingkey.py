@@ -0,0 +1,63 @@
+import fcntl
+import logging
+import os
+import tempfile
+
+from authlib.jose import JsonWebKey
+
+logger = logging.getLogger(__name__)
+
+
+def _import_key_file(key_path):
+    with open(key_path) as key_file:
+        return JsonWebKey.import_key(key_file.read())
+
+
+def _generate_key():
+    return JsonWebKey.generate_key("RSA", 2048, is_private=True)
+
+
+def load_or_generate_signing_key(key_path, persist=True):
+    """
+    Loads the RSA signing key found at `key_path`. If none exists, a new key is generated and, if
+    `persist` is set, written to `key_path` so that other workers and later restarts reuse it
+    instead of each generating their own. If the key cannot be written (e.g. the config volume is
+    read-only), the generated key is only kept in memory.
+    """
+    if os.path.exists(key_path):
+        return _import_key_file(key_path)
+
+    if not persist:
+        return _generate_key()
+
+    # The lock only coordinates the workers of this instance, so keep it out of the config volume.
+    # The temp directory is world-writable, so never follow a link planted at the lock path.
+    lock_path = os.path.join(tempfile.gettempdir(), "quay-" + os.path.basename(key_path) + ".lock")
+    try:
+        lock_fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    except OSError as ose:
+        logger.warning("Could not lock %s, generating an in-memory key: %s", key_path, ose)
+        return _generate_key()
+
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+        # Another process may have written the key while we were waiting on the lock.
+        if os.path.exists(key_path):
+            return _import_key_file(key_path)
+
+        signing_key = _generate_key()
+        tmp_path = key_path + ".tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as key_file:
+                key_file.write(signing_key.as_pem(is_private=True))
+            os.replace(tmp_path, key_path)
+        except OSError as ose:
+            logger.warning("Could not write %s, keeping key in memory: %s", key_path, ose)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return signing_key
+    finally:
+        os.close(lock_fd)
@@ -0,0 +1,77 @@
+import os
+import stat
+
+import pytest
+
+from util.security import signingkey
+from util.security.signingkey import load_or_generate_signing_key
+
+
+@pytest.fixture
+def lock_dir(tmpdir, monkeypatch):
+    lock_dir = tmpdir.mkdir("lock")
+    monkeypatch.setattr(signingkey.tempfile, "gettempdir", lambda: str(lock_dir))
+    return lock_dir
+
+
+def test_missing_key_is_generated_and_persisted(tmpdir, lock_dir):
+    key_path = str(tmpdir.join("docker_v2.pem"))
+
+    generated = load_or_generate_signing_key(key_path)
+    assert os.path.exists(key_path)
+    assert stat.S_IMODE(os.stat(key_path).st_mode) == 0o600
+    assert not os.path.exists(key_path + ".tmp")
+
+    reloaded = load_or_generate_signing_key(key_path)
+    assert reloaded.as_dict(is_private=True) == generated.as_dict(is_private=True)
+
+
+def test_existing_key_is_loaded(tmpdir, lock_dir, monkeypatch):
+    key_path = str(tmpdir.join("docker_v2.pem"))
+    existing = load_or_generate_signing_key(key_path)
+
+    def _fail_generate():
+        raise AssertionError("key should not be regenerated")
+
+    monkeypatch.setattr(signingkey, "_generate_key", _fail_generate)
+    loaded = load_or_generate_signing_key(key_path)
+    assert loaded.as_dict(is_private=True) == existing.as_dict(is_private=True)
+
+
+def test_unwritable_key_is_kept_in_memory(tmpdir, lock_dir, monkeypatch):
+    key_path = str(tmpdir.join("docker_v2.pem"))
+
+    def _fail_replace(src, dst):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(signingkey.os, "replace", _fail_replace)
+    generated = load_or_generate_signing_key(key_path)
+
+    assert generated is not None
+    assert not os.path.exists(key_path)
+    assert not os.path.exists(key_path + ".tmp")
+
+
+def test_missing_config_directory_is_kept_in_memory(tmpdir, lock_dir):
+    key_path = str(tmpdir.join("missing", "docker_v2.pem"))
+
+    assert load_or_generate_signing_key(key_path) is not None
+    assert not os.path.exists(key_path)
+    assert not os.path.exists(key_path + ".tmp")
+
+
+def test_lock_does_not_follow_symlinks(tmpdir, lock_dir):
+    key_path = str(tmpdir.join("docker_v2.pem"))
+    target = tmpdir.join("target")
+    target.write("do not truncate")
+    os.symlink(str(target), str(lock_dir.join("quay-docker_v2.pem.lock")))
+
+    assert load_or_generate_signing_key(key_path) is not None
+    assert target.read() == "do not truncate"
+
+
+def test_no_persist_does_not_write(tmpdir, lock_dir):
+    key_path = str(tmpdir.join("docker_v2.pem"))
+
+    assert load_or_generate_signing_key(key_path, persist=False) is not None
+    assert not os.path.exists(key_path)
@@ -1,6 +1,6 @@
 import pytest
 import os
-from util.log import logfile_path, filter_logs
+from util.log import logfile_path, filter_logs, compile_log_filters
 from app import FILTERED_VALUES
 from _init import CONF_DIR
 
@@ -15,6 +15,16 @@ def test_filter_logs():
     assert values == {"user": {"password": "[FILTERED]"}, "blob": "12345678", "unfiltered": "foo"}
 
 
+def test_filter_logs_compiled():
+    values = {
+        "user": {"password": "toto"},
+        "blob": "1234567890asdfewkqresfdsfewfdsfd",
+        "unfiltered": "foo",
+    }
+    filter_logs(values, compile_log_filters(FILTERED_VALUES))
+    assert values == {"user": {"password": "[FILTERED]"}, "blob": "12345678", "unfiltered": "foo"}
+
+
 @pytest.mark.parametrize(
     "debug,jsonfmt,expected",
     [